@@ -1,12 +1,14 @@
 from dataclasses import dataclass
 from datetime import datetime, date
-from typing import Optional, Union
+from sys import intern
+from typing import Optional, Union, Type
 
 from lxml import etree
 
 from pyfirds.categories import DebtSeniority, OptionType, OptionExerciseStyle, DeliveryType, BaseProduct, SubProduct, \
     FurtherSubProduct, IndexTermUnit, TransactionType, FinalPriceType, FxType, IndexName, StrikePriceType
-from pyfirds.xml_utils import parse_bool, optional, parse_datetime, text_or_none, parse_date, XmlParsed
+from pyfirds.xml_utils import parse_bool, parse_datetime, text_or_none, parse_date, XmlParsed, \
+    child_elements, enum_members
 
 
 @dataclass(slots=True)
@@ -26,10 +28,10 @@ class IndexTerm(XmlParsed):
         :param elem: The XML element to parse. The tag should be `{urn:iso:std:iso:20022:tech:xsd:auth.017.001.02}Term`
             or equivalent.
         """
-        nsmap = elem.nsmap
+        children = child_elements(elem)
         return IndexTerm(
-            number=int(elem.find("Val", nsmap).text),
-            unit=IndexTermUnit[elem.find("Unit", nsmap).text]
+            number=int(children["Val"].text),
+            unit=enum_members(IndexTermUnit)[children["Unit"].text]
         )
 
 @dataclass(slots=True)
@@ -54,18 +56,22 @@ class StrikePrice(XmlParsed):
         :param elem: The XML element to parse. The tag should be
             `{urn:iso:std:iso:20022:tech:xsd:auth.017.001.02}StrkPric` or equivalent.
         """
-        nsmap = elem.nsmap
-        price_xml = elem.find("Pric", nsmap)
+        children = child_elements(elem)
+        price_xml = children.get("Pric")
         if price_xml is not None:
-            if (val_xml := price_xml.find("MntryVal/Amt", nsmap)) is not None:
-                price_type = StrikePriceType.MONETARY_VALUE
-            elif (val_xml := price_xml.find("Pctg", nsmap)) is not None:
-                price_type = StrikePriceType.PERCENTAGE
-            elif (val_xml := price_xml.find("Yld", nsmap)) is not None:
-                price_type = StrikePriceType.YIELD
-            elif (val_xml := price_xml.find("BsisPts", nsmap)) is not None:
-                price_type = StrikePriceType.BASIS_POINTS
-            else:
+            # `Pric` contains exactly one element, the tag of which tells us how the price is expressed.
+            val_xml = next(price_xml.iterchildren(etree.Element), None)
+            price_type = _PRICE_TYPES.get(val_xml.tag.rpartition("}")[2]) if val_xml is not None else None
+            currency = None
+            if price_type is StrikePriceType.MONETARY_VALUE:
+                monetary_value_children = child_elements(val_xml)
+                val_xml = monetary_value_children.get("Amt")
+                # The currency should be given as a `Ccy` attribute of `Amt`, but check for a `Ccy` element as well.
+                if val_xml is not None and (ccy := val_xml.get("Ccy")) is not None:
+                    currency = intern(ccy)
+                else:
+                    currency = text_or_none(monetary_value_children.get("Ccy"), wrapper=intern)
+            if price_type is None or val_xml is None:
                 raise ValueError("`Pric` element present but no price identified when parsing `StrkPric` element.")
             price = text_or_none(val_xml, wrapper=float)
 
@@ -73,18 +79,27 @@ class StrikePrice(XmlParsed):
                 price_type=price_type,
                 price=price,
                 pending=False,
-                currency=text_or_none(price_xml.find("MntryVal/Ccy", nsmap))
+                currency=currency
             )
         else:
-            no_price_xml = elem.find("NoPric", nsmap)
+            no_price_children = child_elements(children["NoPric"])
             return StrikePrice(
                 price_type=StrikePriceType.NO_PRICE,
                 price=None,
-                pending=no_price_xml.find("Pdg", nsmap).text == "PNDG",
-                currency=text_or_none(no_price_xml.find("Ccy", nsmap))
+                pending=no_price_children["Pdg"].text == "PNDG",
+                currency=text_or_none(no_price_children.get("Ccy"), wrapper=intern)
             )
 
 
+_PRICE_TYPES = {
+    "MntryVal": StrikePriceType.MONETARY_VALUE,
+    "Pctg": StrikePriceType.PERCENTAGE,
+    "Yld": StrikePriceType.YIELD,
+    "BsisPts": StrikePriceType.BASIS_POINTS
+}
+"""Maps the local name of the element within a `StrkPric/Pric` element to the way in which the price is expressed."""
+
+
 @dataclass(slots=True)
 class Index(XmlParsed):
     """An index or benchmark rate that is used in the reference data for certain financial instruments.
@@ -106,21 +121,19 @@ class Index(XmlParsed):
             FULINS XSD.
         """
 
-        nsmap = elem.nsmap
-        ref_rate_elem = elem.find("RefRate", nsmap)
-        index_text = text_or_none(ref_rate_elem.find("Indx", nsmap))
+        children = child_elements(elem)
+        ref_rate_children = child_elements(children["RefRate"])
+        index_text = text_or_none(ref_rate_children.get("Indx"))
         if index_text is not None:
             # Try to get the appropriate IndexName enum, otherwise just treat the value as a string
-            try:
-                name = IndexName[index_text]
-            except KeyError:
-                name = index_text
+            name = enum_members(IndexName).get(index_text, index_text)
         else:
-            name = text_or_none(ref_rate_elem.find("Nm", nsmap))
+            name = text_or_none(ref_rate_children.get("Nm"))
+        term_elem = children.get("Term")
         return Index(
-            isin=text_or_none(ref_rate_elem.find("ISIN", nsmap)),
+            isin=text_or_none(ref_rate_children.get("ISIN")),
             name=name,
-            term=optional(elem.find("Term", nsmap), IndexTerm)
+            term=IndexTerm.from_xml(term_elem) if term_elem is not None else None
         )
 
 
@@ -153,14 +166,14 @@ class TradingVenueAttributes(XmlParsed):
         :param elem: The XML element to parse. The tag should be
             `{urn:iso:std:iso:20022:tech:xsd:auth.017.001.02}TradgVnRltAttrbts` or equivalent.
         """
-        nsmap = elem.nsmap
+        children = child_elements(elem)
         return TradingVenueAttributes(
-            trading_venue=elem.find("Id", nsmap).text,
-            requested_admission=parse_bool(elem.find("IssrReq", nsmap)),
-            approval_date=parse_datetime(elem.find("AdmssnApprvlDtByIssr", nsmap), optional=True),
-            request_date=parse_datetime(elem.find("ReqForAdmssnDt", nsmap), optional=True),
-            admission_or_first_trade_date=parse_datetime(elem.find("FrstTradDt", nsmap)),
-            termination_date=parse_datetime(elem.find("TermntnDt", nsmap), optional=True)
+            trading_venue=intern(children["Id"].text),
+            requested_admission=parse_bool(children.get("IssrReq")),
+            approval_date=parse_datetime(children.get("AdmssnApprvlDtByIssr"), optional=True),
+            request_date=parse_datetime(children.get("ReqForAdmssnDt"), optional=True),
+            admission_or_first_trade_date=parse_datetime(children.get("FrstTradDt")),
+            termination_date=parse_datetime(children.get("TermntnDt"), optional=True)
         )
 
 
@@ -197,15 +210,15 @@ class InterestRate(XmlParsed):
         :param elem: The XML element to parse. The tag should be
             `{urn:iso:std:iso:20022:tech:xsd:auth.017.001.02}IntrstRate` or equivalent.
         """
-        nsmap = elem.nsmap
-        floating_elem = elem.find("Fltg", nsmap)
+        children = child_elements(elem)
+        floating_elem = children.get("Fltg")
         if floating_elem is not None:
-            spread = text_or_none(floating_elem.find("BsisPtSprd", nsmap), wrapper=int)
+            spread = text_or_none(child_elements(floating_elem).get("BsisPtSprd"), wrapper=int)
         else:
             spread = None
         return InterestRate(
-            fixed_rate=text_or_none(elem.find("Fxd", nsmap), float),
-            benchmark=optional(floating_elem, Index),
+            fixed_rate=text_or_none(children.get("Fxd"), float),
+            benchmark=Index.from_xml(floating_elem) if floating_elem is not None else None,
             spread=spread
         )
 
@@ -227,16 +240,17 @@ class PublicationPeriod(XmlParsed):
         :param elem: The XML element to parse. The tag should be
             `{urn:iso:std:iso:20022:tech:xsd:auth.017.001.02}PblctnPrd` or equivalent.
         """
-        nsmap = elem.nsmap
-        from_to = elem.find("FrDtToDt", nsmap)
+        children = child_elements(elem)
+        from_to = children.get("FrDtToDt")
         if from_to is not None:
+            from_to_children = child_elements(from_to)
             return PublicationPeriod(
-                from_date=parse_date(from_to.find("FrDt", nsmap)),
-                to_date=parse_date(from_to.find("ToDt", nsmap), optional=True)
+                from_date=parse_date(from_to_children.get("FrDt")),
+                to_date=parse_date(from_to_children.get("ToDt"), optional=True)
             )
         else:
             return PublicationPeriod(
-                from_date=parse_date(elem.find("FrDt", nsmap)),
+                from_date=parse_date(children.get("FrDt")),
                 to_date=None
             )
 
@@ -264,11 +278,14 @@ class TechnicalAttributes(XmlParsed):
         :param elem: The XML element to parse. The tag should be
             `{urn:iso:std:iso:20022:tech:xsd:auth.017.001.02}TechAttrbts` or equivalent.
         """
-        nsmap = elem.nsmap
+        children = child_elements(elem)
+        publication_period_elem = children.get("PblctnPrd")
         return TechnicalAttributes(
-            relevant_competent_authority=text_or_none(elem.find("RlvntCmptntAuthrty", nsmap)),
-            publication_period=optional(elem.find("PblctnPrd", nsmap), PublicationPeriod),
-            relevant_trading_venue=text_or_none(elem.find("RlvntTradgVn", nsmap))
+            relevant_competent_authority=text_or_none(children.get("RlvntCmptntAuthrty"), wrapper=intern),
+            publication_period=(
+                PublicationPeriod.from_xml(publication_period_elem) if publication_period_elem is not None else None
+            ),
+            relevant_trading_venue=text_or_none(children.get("RlvntTradgVn"), wrapper=intern)
         )
 
 
@@ -292,15 +309,15 @@ class DebtAttributes(XmlParsed):
 
     @classmethod
     def from_xml(cls, elem: etree.Element) -> "DebtAttributes":
-        nsmap = elem.nsmap
-        issued_amount_elem = elem.find("TtlIssdNmnlAmt", nsmap)
+        children = child_elements(elem)
+        issued_amount_elem = children["TtlIssdNmnlAmt"]
         return DebtAttributes(
             total_issued_amount=float(issued_amount_elem.text),
-            maturity_date=parse_date(elem.find("MtrtyDt", nsmap), optional=True),
-            nominal_currency=issued_amount_elem.attrib["Ccy"],
-            nominal_value_per_unit=float(elem.find("NmnlValPerUnit", nsmap).text),
-            interest_rate=InterestRate.from_xml(elem.find("IntrstRate", nsmap)),
-            seniority=text_or_none(elem.find("DebtSnrty", nsmap), wrapper=DebtSeniority)
+            maturity_date=parse_date(children.get("MtrtyDt"), optional=True),
+            nominal_currency=intern(issued_amount_elem.get("Ccy")),
+            nominal_value_per_unit=float(children["NmnlValPerUnit"].text),
+            interest_rate=InterestRate.from_xml(children["IntrstRate"]),
+            seniority=text_or_none(children.get("DebtSnrty"), wrapper=DebtSeniority)
         )
 
 
@@ -328,30 +345,36 @@ class CommodityDerivativeAttributes(XmlParsed):
             `{urn:iso:std:iso:20022:tech:xsd:auth.017.001.02}Cmmdty` or equivalent.
         """
         # Normal structure is `Pdct/<base product>/<sub product>/BasePdct`, but if the base product does not have an
-        # associated sub product then structure will be `Pdct/<base product>/BasePdct`. So we first check for
-        # `BasePdct` two levels down, if it's not there we check one level down. We also know at that point that
-        # there is no sub product (and therefore no further sub product) associated.
-        nsmap = elem.nsmap
-        product_container_elem = elem.find("Pdct", nsmap)
-        base_prod_elem = product_container_elem.find("*/*/BasePdct", nsmap)
-        if base_prod_elem is None:
+        # associated sub product then structure will be `Pdct/<base product>/BasePdct`. `Pdct` and `<base product>`
+        # each have exactly one child element, so we descend to the first child of `<base product>` and check whether
+        # it is `BasePdct`. If it is, we know there is no sub product (and therefore no further sub product)
+        # associated.
+        children = child_elements(elem)
+        base_prod_container_elem = next(children["Pdct"].iterchildren(etree.Element), None)
+        product_elem = (
+            next(base_prod_container_elem.iterchildren(etree.Element), None)
+            if base_prod_container_elem is not None else None
+        )
+        if product_elem is None:
+            raise ValueError("`Pdct` element present but no base product identified when parsing `Cmmdty` element.")
+        if product_elem.tag.rpartition("}")[2] == "BasePdct":
             # No sub product
-            base_product = BaseProduct[product_container_elem.find("*/BasePdct", nsmap).text]
+            base_product = enum_members(BaseProduct)[product_elem.text]
             sub_product = None
             further_sub_product = None
         else:
             # Sub product
-            base_product = BaseProduct[base_prod_elem.text]
-            product_elem = base_prod_elem.getparent()
-            sub_product = text_or_none(product_elem.find("SubPdct", nsmap), SubProduct)
-            further_sub_product = text_or_none(product_elem.find("AddtlSubPdct", nsmap), FurtherSubProduct)
+            product_children = child_elements(product_elem)
+            base_product = enum_members(BaseProduct)[product_children["BasePdct"].text]
+            sub_product = text_or_none(product_children.get("SubPdct"), SubProduct)
+            further_sub_product = text_or_none(product_children.get("AddtlSubPdct"), FurtherSubProduct)
 
         return CommodityDerivativeAttributes(
             base_product=base_product,
             sub_product=sub_product,
             further_sub_product=further_sub_product,
-            transaction_type=text_or_none(elem.find("TxTp", nsmap), wrapper=TransactionType),
-            final_price_type=text_or_none(elem.find("FnlPricTp", nsmap), wrapper=FinalPriceType)
+            transaction_type=text_or_none(children.get("TxTp"), wrapper=TransactionType),
+            final_price_type=text_or_none(children.get("FnlPricTp"), wrapper=FinalPriceType)
         )
 
 
@@ -379,18 +402,25 @@ class InterestRateDerivativeAttributes(XmlParsed):
         :param elem: The XML element to parse. The tag should be
             `{urn:iso:std:iso:20022:tech:xsd:auth.017.001.02}Intrst` or equivalent.
         """
-        nsmap = elem.nsmap
-        other_leg_elem = elem.find("OthrLegIntrstRate", nsmap)
+        children = child_elements(elem)
+        other_leg_elem = children.get("OthrLegIntrstRate")
         if other_leg_elem is not None:
-            fixed_rate_2 = text_or_none(other_leg_elem.find("Fxd", nsmap), wrapper=float)
-            floating_rate_2 = optional(other_leg_elem.find("Fltg", nsmap), Index)
+            other_leg_children = child_elements(other_leg_elem)
+            fixed_rate_2 = text_or_none(other_leg_children.get("Fxd"), wrapper=float)
+            floating_elem = other_leg_children.get("Fltg")
+            floating_rate_2 = Index.from_xml(floating_elem) if floating_elem is not None else None
         else:
             fixed_rate_2 = None
             floating_rate_2 = None
+        first_leg_elem = children.get("FrstLegIntrstRate")
+        if first_leg_elem is not None:
+            fixed_rate_1 = text_or_none(child_elements(first_leg_elem).get("Fxd"), wrapper=float)
+        else:
+            fixed_rate_1 = None
         return InterestRateDerivativeAttributes(
-            reference_rate=Index.from_xml(elem.find("IntrstRate", nsmap)),
-            notional_currency_2=text_or_none(elem.find("OtherNtnlCcy", nsmap)),
-            fixed_rate_1=text_or_none(elem.find("FrstLegIntrstRate/Fxd", nsmap), wrapper=float),
+            reference_rate=Index.from_xml(children["IntrstRate"]),
+            notional_currency_2=text_or_none(children.get("OtherNtnlCcy"), wrapper=intern),
+            fixed_rate_1=fixed_rate_1,
             fixed_rate_2=fixed_rate_2,
             floating_rate_2=floating_rate_2
         )
@@ -413,10 +443,10 @@ class FxDerivativeAttributes(XmlParsed):
         :param elem: The XML element to parse. The tag should be `{urn:iso:std:iso:20022:tech:xsd:auth.017.001.02}FX` or
             equivalent.
         """
-        nsmap = elem.nsmap
+        children = child_elements(elem)
         return FxDerivativeAttributes(
-            notional_currency_2=elem.find("OtherNtnlCcy", nsmap).text,
-            fx_type=FxType[elem.find("FxTp", nsmap).text]
+            notional_currency_2=intern(children["OtherNtnlCcy"].text),
+            fx_type=enum_members(FxType)[children["FxTp"].text]
         )
 
 
@@ -472,33 +502,44 @@ class DerivativeUnderlying(XmlParsed):
             `{urn:iso:std:iso:20022:tech:xsd:auth.017.001.02}UndrlygInstrm` or equivalent.
         """
 
-        nsmap = elem.nsmap
+        children = child_elements(elem)
         single = basket = None
-        if (single_underlying := elem.find("Sngl", nsmap)) is not None:
+        if (single_underlying := children.get("Sngl")) is not None:
+            single_children = child_elements(single_underlying)
             # An index can be represented by an ISIN or by a name and optional term. Just like our Index dataclass.
             # Annoyingly, unlike with `Fltg` elements where all three elements are combined in a single `RefRate`
             # element, here the ISIN, if present, is directly under `Indx` whereas the name and term are under
             # `Index/Nm/RefRate`.
-            index_xml = single_underlying.find("Indx", nsmap)
+            index_xml = single_children.get("Indx")
             if index_xml is None:
                 index = None
             else:
-                index_isin = text_or_none(index_xml.find("ISIN", nsmap))
-                index = optional(index_xml.find("Nm", nsmap), Index)
-                if index is None:
+                index_children = child_elements(index_xml)
+                index_isin = text_or_none(index_children.get("ISIN"))
+                index_name_xml = index_children.get("Nm")
+                if index_name_xml is None:
                     index = Index(isin=index_isin, name=None, term=None)
                 else:
+                    index = Index.from_xml(index_name_xml)
                     index.isin = index_isin
 
             single = UnderlyingSingle(
-                isin=text_or_none(single_underlying.find("ISIN", nsmap)),
+                isin=text_or_none(single_children.get("ISIN")),
                 index=index,
-                issuer_lei=text_or_none(single_underlying.find("LEI", nsmap))
+                issuer_lei=text_or_none(single_children.get("LEI"))
             )
-        elif (basket_underlying := elem.find("Bskt", nsmap)) is not None:
+        elif (basket_underlying := children.get("Bskt")) is not None:
+            isin = []
+            issuer_lei = []
+            for child in basket_underlying.iterchildren(etree.Element):
+                localname = child.tag.rpartition("}")[2]
+                if localname == "ISIN":
+                    isin.append(child.text)
+                elif localname == "LEI":
+                    issuer_lei.append(child.text)
             basket = UnderlyingBasket(
-                isin=[i.text for i in basket_underlying.findall("ISIN", nsmap)],
-                issuer_lei=[i.text for i in basket_underlying.findall("LEI", nsmap)]
+                isin=isin,
+                issuer_lei=issuer_lei
             )
         else:
             raise ValueError("Could not find `Sngl` or `Bskt` element in `UndrlygInstrm` element.")
@@ -549,29 +590,28 @@ class DerivativeAttributes(XmlParsed):
         :param elem: The XML element to parse, as a :class:`etree._Element` object.
         """
         # TODO: Continue refactor
-        nsmap = elem.nsmap
+        children = child_elements(elem)
+        asset_class_elem = children.get("AsstClssSpcfcAttrbts")
+        asset_class_attrs = child_elements(asset_class_elem) if asset_class_elem is not None else {}
+        underlying_elem = children.get("UndrlygInstrm")
+        strike_price_elem = children.get("StrkPric")
+        commodity_elem = asset_class_attrs.get("Cmmdty")
+        ir_elem = asset_class_attrs.get("Intrst")
+        fx_elem = asset_class_attrs.get("Fx")
         return DerivativeAttributes(
-            expiry_date=parse_date(elem.find("XpryDt", nsmap), optional=True),
-            price_multiplier=text_or_none(elem.find("PricMltplr", nsmap), wrapper=float),
+            expiry_date=parse_date(children.get("XpryDt"), optional=True),
+            price_multiplier=text_or_none(children.get("PricMltplr"), wrapper=float),
             # Will probably need single "Underlying" class
-            underlying=optional(elem.find("UndrlygInstrm", nsmap), DerivativeUnderlying),
-            option_type=text_or_none(elem.find("OptnTp", nsmap), wrapper=OptionType),
-            strike_price=optional(elem.find("StrkPric", nsmap), StrikePrice),
-            option_exercise_style=text_or_none(elem.find("OptnExrcStyle", nsmap),
-                                               wrapper=OptionExerciseStyle),
-            delivery_type=text_or_none(elem.find("DlvryTp", nsmap), wrapper=DeliveryType),
-            commodity_attributes=optional(
-                elem.find("AsstClssSpcfcAttrbts/Cmmdty", nsmap),
-                CommodityDerivativeAttributes
+            underlying=DerivativeUnderlying.from_xml(underlying_elem) if underlying_elem is not None else None,
+            option_type=text_or_none(children.get("OptnTp"), wrapper=OptionType),
+            strike_price=StrikePrice.from_xml(strike_price_elem) if strike_price_elem is not None else None,
+            option_exercise_style=text_or_none(children.get("OptnExrcStyle"), wrapper=OptionExerciseStyle),
+            delivery_type=text_or_none(children.get("DlvryTp"), wrapper=DeliveryType),
+            commodity_attributes=(
+                CommodityDerivativeAttributes.from_xml(commodity_elem) if commodity_elem is not None else None
             ),
-            ir_attributes=optional(
-                elem.find("AsstClssSpcfcAttrbts/Intrst", nsmap),
-                InterestRateDerivativeAttributes
-            ),
-            fx_attributes=optional(
-                elem.find("AsstClssSpcfcAttrbts/Fx", nsmap),
-                FxDerivativeAttributes
-            )
+            ir_attributes=InterestRateDerivativeAttributes.from_xml(ir_elem) if ir_elem is not None else None,
+            fx_attributes=FxDerivativeAttributes.from_xml(fx_elem) if fx_elem is not None else None
         )
 
 
@@ -619,47 +659,67 @@ class ReferenceData(XmlParsed):
         """
         return self.isin + self.technical_attributes.relevant_trading_venue
 
+    def __hash__(self) -> int:
+        """Hash the object by its ISIN and relevant trading venue (ie, the components of `unique_id`), so that objects
+        can be deduplicated using sets or dicts without hashing every field. Equality still compares all fields, so
+        objects which are equal always have the same hash. Unlike `unique_id`, this does not require the technical
+        attributes or relevant trading venue to be present.
+        """
+        return hash((self.isin, self.technical_attributes and self.technical_attributes.relevant_trading_venue))
+
     @classmethod
     def from_xml(cls, elem: etree.Element) -> "ReferenceData":
         """Parse a `RefData` XML element from FIRDS into a :class:`ReferenceData` object (or appropriate subclass).
 
         :param elem: The XML element to parse. The tag should be
-            `{urn:iso:std:iso:20022:tech:xsd:auth.017.001.02}RefData` or an equivalent XML element which belongs to the
-            `document` namespace in `nsmap`.
+            `{urn:iso:std:iso:20022:tech:xsd:auth.017.001.02}RefData` or equivalent. Child elements are matched by local
+            name, so the element may belong to any namespace (eg, the auth.036 namespace used in DLTINS files).
         """
-        nsmap = elem.nsmap
-        gen_attrs = elem.find("FinInstrmGnlAttrbts", nsmap)
+        children = child_elements(elem)
+        gen_attrs = child_elements(children["FinInstrmGnlAttrbts"])
+        debt_elem = children.get("DebtInstrmAttrbts")
+        deriv_elem = children.get("DerivInstrmAttrbts")
         return cls(
-            isin=gen_attrs.find("Id", nsmap).text,
-            full_name=gen_attrs.find("FullNm", nsmap).text,
-            cfi=gen_attrs.find("ClssfctnTp", nsmap).text,
-            is_commodities_derivative=parse_bool(gen_attrs.find("CmmdtyDerivInd", nsmap)),
-            issuer_lei=elem.find("Issr", nsmap).text,
-            fisn=gen_attrs.find("ShrtNm", nsmap).text,
-            trading_venue_attrs=TradingVenueAttributes.from_xml(elem.find("TradgVnRltdAttrbts", nsmap)),
-            notional_currency=gen_attrs.find("NtnlCcy", nsmap).text,
-            technical_attributes=TechnicalAttributes.from_xml(elem.find("TechAttrbts", nsmap)),
-            debt_attributes=optional(elem.find("DebtInstrmAttrbts", nsmap), DebtAttributes),
-            derivative_attributes=optional(elem.find("DerivInstrmAttrbts", nsmap), DerivativeAttributes)
+            isin=gen_attrs["Id"].text,
+            full_name=gen_attrs["FullNm"].text,
+            cfi=intern(gen_attrs["ClssfctnTp"].text),
+            is_commodities_derivative=parse_bool(gen_attrs.get("CmmdtyDerivInd")),
+            issuer_lei=intern(children["Issr"].text),
+            fisn=gen_attrs["ShrtNm"].text,
+            trading_venue_attrs=TradingVenueAttributes.from_xml(children["TradgVnRltdAttrbts"]),
+            notional_currency=intern(gen_attrs["NtnlCcy"].text),
+            technical_attributes=TechnicalAttributes.from_xml(children["TechAttrbts"]),
+            debt_attributes=DebtAttributes.from_xml(debt_elem) if debt_elem is not None else None,
+            derivative_attributes=DerivativeAttributes.from_xml(deriv_elem) if deriv_elem is not None else None
         )
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class NewRecord(ReferenceData):
     """Reference data for a newly added financial instrument. Supports all the same properties and methods as
     :class:`ReferenceData`."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ModifiedRecord(ReferenceData):
     """Modified reference data for a financial instrument. Supports all the same properties and methods as
     :class:`ReferenceData`."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class TerminatedRecord(ReferenceData):
     """Reference data for a financial instrument that has ceased being traded on a trading venue. Supports all the same
     properties and methods as :class:`ReferenceData`."""
     pass
+
+
+RECORD_CLASSES: dict[str, Type[ReferenceData]] = {
+    "RefData": ReferenceData,
+    "NewRcrd": NewRecord,
+    "ModfdRcrd": ModifiedRecord,
+    "TermntdRcrd": TerminatedRecord
+}
+"""Maps the local name of each XML element which describes a financial instrument to the class it should be parsed
+into. Can be passed to :func:`pyfirds.xml_utils.iterparse` to parse all the records in a FULINS or DLTINS file."""
@@ -1,25 +1,36 @@
+import os
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date
-from enum import Enum
-from typing import Optional, Union, Callable, Type, TypeVar, Generator
+from enum import Enum, EnumMeta
+from functools import lru_cache
+from typing import Optional, Union, Callable, Type, TypeVar, Generator, Iterable, BinaryIO
 
 from dateutil.parser import parse
 from lxml import etree
-from lxml.etree import QName
 
 
 class XmlParsed(ABC):
     """A base class for objects which can be parsed from an XML element."""
 
+    # Declared so that slotted subclasses do not also get a per-instance `__dict__`.
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def from_xml(cls, elem: etree.Element) -> 'XmlParsed':
-        """Create an instance of the class from an appropriate XML element."""
+        """Create an instance of the class from an appropriate XML element.
+
+        Implementations must extract everything they need from `elem` before returning, and must not keep references to
+        it or its descendants, as :func:`iterparse` clears each element once it has been parsed.
+        """
         raise NotImplementedError
 
 
 T = TypeVar("T")
 X = TypeVar("X", bound=XmlParsed)
+E = TypeVar("E", bound=Enum)
 
 
 def text_or_none(
@@ -40,12 +51,35 @@ def text_or_none(
         text = elem.text
         if wrapper is None:
             return text
-        elif issubclass(wrapper, Enum):
-            return wrapper[text]
+        elif isinstance(wrapper, EnumMeta):
+            return enum_members(wrapper)[text]
         else:
             return wrapper(text)
 
 
+def enum_members(cls: Type[E]) -> dict[str, E]:
+    """Return a dict mapping the name of each member of the given :class:`enum.Enum` subtype to the member itself.
+
+    Looking up a member in the dict is quicker than subscripting the enum, which goes through `EnumMeta.__getitem__`.
+    The dict is created the first time it is requested for a given enum and reused thereafter, so it should not be
+    modified.
+
+    :param cls: The Enum subtype.
+    """
+    try:
+        return _ENUM_MEMBERS[cls]
+    except KeyError:
+        members = _ENUM_MEMBERS[cls] = dict(cls.__members__)
+        return members
+
+
+_ENUM_MEMBERS: dict[Type[Enum], dict[str, Enum]] = {}
+"""Maps each Enum subtype passed to :func:`enum_members` to a dict of its members by name."""
+
+
+_BOOLS = {"true": True, "false": False}
+
+
 def parse_bool(elem: Optional[etree.Element], optional: bool = False) -> Optional[bool]:
     """Parse a true or false value in the FIRDS data to a bool.
 
@@ -58,13 +92,15 @@ def parse_bool(elem: Optional[etree.Element], optional: bool = False) -> Optiona
             return None
         else:
             raise ValueError(f"Received NoneType when parsing non-optional element.")
-    value = elem.text.lower()
-    if value == "true":
-        return True
-    elif value == "false":
-        return False
-    else:
-        raise ValueError(f"Cannot convert string '{value}' to boolean.")
+    value = elem.text
+    try:
+        return _BOOLS[value]
+    except KeyError:
+        # FIRDS uses lower case, but accept other cases as well.
+        try:
+            return _BOOLS[value.lower()]
+        except KeyError:
+            raise ValueError(f"Cannot convert string '{value}' to boolean.") from None
 
 
 def parse_datetime(elem: Optional[etree.Element], optional: bool = False) -> Optional[datetime]:
@@ -78,8 +114,21 @@ def parse_datetime(elem: Optional[etree.Element], optional: bool = False) -> Opt
             return None
         else:
             raise ValueError(f"Received NoneType when parsing non-optional element.")
-    value = elem.text
-    return parse(value)
+    return _parse_timestamp(elem.text)
+
+
+@lru_cache(maxsize=8192)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a timestamp string to a datetime object. Used by :func:`parse_datetime`.
+
+    The same timestamps recur across many records in a FIRDS file, so results are cached. This is safe as datetime
+    objects are immutable.
+    """
+    try:
+        # FIRDS timestamps are almost always ISO 8601, which the standard library can parse much faster than dateutil.
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parse(value)
 
 
 def parse_date(elem: Optional[etree.Element], optional: bool = False) -> Optional[date]:
@@ -97,20 +146,59 @@ def parse_date(elem: Optional[etree.Element], optional: bool = False) -> Optiona
     return date.fromisoformat(value)
 
 
-def optional(elem: Optional[etree.Element], cls: Type[X]) -> Optional[X]:
-    if elem is None:
-        return None
-    else:
-        return cls.from_xml(elem)
+def child_elements(elem: etree.Element) -> dict[str, etree.Element]:
+    """Map the local name (ie, the tag without the namespace) of each child element of `elem` to the child itself.
+
+    This walks the children of `elem` once, so it is considerably cheaper than calling `find` separately for each child
+    we are interested in. It also does not depend on the namespace of the element, which differs between versions of
+    the FIRDS schema (and between FULINS and DLTINS files).
+
+    :param elem: The XML element whose children should be mapped.
+    :return: A dict mapping local names to child elements. Where more than one child has the same local name, only the
+        last is included, so this is not suitable for elements which can be repeated.
+    """
+    return {child.tag.rpartition("}")[2]: child for child in elem.iterchildren(etree.Element)}
+
+
+def _iter_elements(
+        file: Union[str, BinaryIO],
+        localnames: Iterable[str]
+) -> Generator[tuple[str, etree.Element], None, None]:
+    """Parse an XML file iteratively, yielding each element whose tag has one of the given local names (along with that
+    local name). Once the caller has finished with an element, it is deleted, along with anything before it in the
+    tree, to preserve memory.
+
+    :param file: Path to the XML file to parse, or a binary file-like object to read it from.
+    :param localnames: The local names (ie, the tag names after the namespace bit) of the elements to yield.
+    """
+    tags = ["{*}" + t for t in localnames]
+    # Whitespace between elements is never used, so don't create text nodes for it. Entities are not used in FIRDS data
+    # so there is no need to resolve them.
+    for evt, elem in etree.iterparse(file, tag=tags, remove_blank_text=True, resolve_entities=False):
+        yield elem.tag.rpartition("}")[2], elem
+        elem.clear()
+        # Walk up the tree deleting already-processed siblings of the element and its ancestors. This is done directly
+        # rather than with an `ancestor-or-self::*` XPath query, which would need to be evaluated for every element. The
+        # walk stops at the root, whose only possible siblings are comments or processing instructions, which can't be
+        # deleted.
+        node = elem
+        parent = node.getparent()
+        while parent is not None:
+            while node.getprevious() is not None:
+                del parent[0]
+            node = parent
+            parent = node.getparent()
 
 
 def iterparse(
-        file: str,
+        file: Union[str, BinaryIO],
         tag_localname_to_cls: dict[str, Type[X]]
 ) -> Generator[X, None, dict[str, int]]:
     """Parse an XML file iteratively, creating and yielding a :class:`ReferenceData` (or subclass) object from each
     relevant node, and deleting nodes as we finish with them, to preserve memory.
-    :param file: Path to the XML file to parse.
+    :param file: Path to the XML file to parse, or a binary file-like object to read it from (such as a member of a zip
+        file opened with :meth:`zipfile.ZipFile.open`). The file is read incrementally, so it does not need to be
+        extracted or loaded into memory first.
     :param tag_localname_to_cls: A dict mapping each XML tag name (after the namespace bit) to the class to be generated
         from it (which should be a subclass of :class:`BaseXmlParsed` or otherwise have an appropriate `from_xml` class
         method).
@@ -118,17 +206,69 @@ def iterparse(
     :return: A dict specifying the number of XML elements of each given tag encountered.
     """
 
-    tags = ["{*}" + t for t in tag_localname_to_cls]
-
     count = {t: 0 for t in tag_localname_to_cls}
-    for evt, elem in etree.iterparse(file, tag=tags):
-        localname = QName(elem).localname
+    for localname, elem in _iter_elements(file, tag_localname_to_cls):
         cls = tag_localname_to_cls[localname]
         obj = cls.from_xml(elem)
-        elem.clear()
-        for ancestor in elem.xpath('ancestor-or-self::*'):
-            while ancestor.getprevious() is not None:
-                del ancestor.getparent()[0]
         count[localname] += 1
         yield obj
     return count
+
+
+def _parse_batch(batch: list[tuple[str, bytes]], tag_localname_to_cls: dict[str, Type[X]]) -> list[X]:
+    """Parse a batch of serialised XML elements. Used by :func:`parallel_iterparse` in the worker processes.
+
+    :param batch: A list of (local name, serialised XML element) tuples.
+    :param tag_localname_to_cls: See :func:`iterparse`.
+    """
+    return [tag_localname_to_cls[localname].from_xml(etree.fromstring(xml)) for localname, xml in batch]
+
+
+def parallel_iterparse(
+        file: Union[str, BinaryIO],
+        tag_localname_to_cls: dict[str, Type[X]],
+        max_workers: Optional[int] = None,
+        batch_size: int = 1000
+) -> Generator[X, None, dict[str, int]]:
+    """Like :func:`iterparse`, but create the objects in a pool of worker processes.
+
+    The XML file is still read in the calling process, but the relevant elements are serialised and sent to the worker
+    processes in batches, where they are parsed into objects. As creating the objects is the expensive part of parsing
+    FIRDS data, this can be considerably faster than :func:`iterparse` on a machine with several cores. Objects are
+    yielded in the same order as :func:`iterparse` would yield them, and only a limited number of batches are in flight
+    at any time, so memory usage remains bounded.
+
+    The strings which the parsers intern (such as currency codes and MICs) are interned in the worker processes, and
+    interning does not survive being sent back to this process. Objects within a batch still share a single copy of
+    each such string, as pickle only serialises each object once, but objects from different batches do not. Keeping a
+    large number of objects from this function in memory may therefore use somewhat more memory than keeping the same
+    objects from :func:`iterparse`; a larger `batch_size` reduces the difference.
+
+    :param file: See :func:`iterparse`.
+    :param tag_localname_to_cls: See :func:`iterparse`. The classes must be importable by the worker processes (ie, not
+        defined locally in a function).
+    :param max_workers: The number of worker processes to use. Defaults to the number of CPUs on the machine.
+    :param batch_size: The number of elements to send to a worker process at a time.
+
+    :return: A dict specifying the number of XML elements of each given tag encountered.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    count = {t: 0 for t in tag_localname_to_cls}
+    pending = deque()
+    batch = []
+    with ProcessPoolExecutor(max_workers) as executor:
+        for localname, elem in _iter_elements(file, tag_localname_to_cls):
+            batch.append((localname, etree.tostring(elem, with_tail=False)))
+            count[localname] += 1
+            if len(batch) >= batch_size:
+                pending.append(executor.submit(_parse_batch, batch, tag_localname_to_cls))
+                batch = []
+                # Wait for the oldest batch before reading further if enough batches are in flight to keep all the
+                # workers busy.
+                if len(pending) > 2 * max_workers:
+                    yield from pending.popleft().result()
+        if batch:
+            pending.append(executor.submit(_parse_batch, batch, tag_localname_to_cls))
+        while pending:
+            yield from pending.popleft().result()
+    return count
@@ -0,0 +1,89 @@
+import os
+from enum import Enum
+
+import pytest
+from lxml import etree
+
+from pyfirds.categories import StrikePriceType, FxType
+from pyfirds.model import CommodityDerivativeAttributes, ReferenceData, NewRecord, ModifiedRecord, TerminatedRecord
+from pyfirds.xml_utils import iterparse, parallel_iterparse, text_or_none, enum_members, _ENUM_MEMBERS
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+FULINS_SAMPLE = os.path.join(FIXTURES_DIR, "FULINS_sample.xml")
+
+
+def test_01_hash():
+    """Test that records can be hashed and deduplicated, including records without a relevant trading venue."""
+    ref_data = list(iterparse(FULINS_SAMPLE, {"RefData": ReferenceData}))
+    no_venue = [r for r in ref_data if r.technical_attributes.relevant_trading_venue is None]
+    assert no_venue
+    for r in no_venue:
+        hash(r)
+    assert ref_data[0] == ref_data[1]
+    assert hash(ref_data[0]) == hash(ref_data[1])
+    assert len(set(ref_data)) == len(ref_data) - 1
+
+
+def test_02_parallel():
+    """Test that parsing in worker processes, with more than one batch, gives the same results as parsing in a single
+    process."""
+    tags = {"RefData": ReferenceData}
+    serial = list(iterparse(FULINS_SAMPLE, tags))
+    parallel = list(parallel_iterparse(FULINS_SAMPLE, tags, max_workers=2, batch_size=3))
+    assert len(serial) > 3
+    assert serial == parallel
+
+
+def test_03_comment_before_root():
+    """Test parsing a file with a comment before the root element, which cannot be deleted once it has been parsed."""
+    with open(FULINS_SAMPLE, "rb") as f:
+        assert f.read().splitlines()[1].startswith(b"<!--")
+    assert len(list(iterparse(FULINS_SAMPLE, {"RefData": ReferenceData}))) == 6
+
+
+def test_04_strike_price():
+    """Test parsing the currency of a strike price given as a monetary value (as an attribute of `Amt`) and of a pending
+    strike price (as a `Ccy` element of `NoPric`)."""
+    ref_data = {r.isin: r for r in iterparse(FULINS_SAMPLE, {"RefData": ReferenceData})}
+
+    monetary_value = ref_data["DE000C8ZT4Q2"].derivative_attributes.strike_price
+    assert monetary_value.price_type == StrikePriceType.MONETARY_VALUE
+    assert monetary_value.price == 52.5
+    assert not monetary_value.pending
+    assert monetary_value.currency == "EUR"
+
+    no_price = ref_data["DE000C8ZT4R0"].derivative_attributes.strike_price
+    assert no_price.price_type == StrikePriceType.NO_PRICE
+    assert no_price.price is None
+    assert no_price.pending
+    assert no_price.currency == "USD"
+
+
+def test_05_record_slots():
+    """Test that the record subclasses are slotted (ie, instances have no `__dict__`) and are hashable."""
+    for cls in (NewRecord, ModifiedRecord, TerminatedRecord):
+        ref_data = list(iterparse(FULINS_SAMPLE, {"RefData": cls}))
+        for r in ref_data:
+            assert isinstance(r, cls)
+            assert not hasattr(r, "__dict__")
+        assert len(set(ref_data)) == len(ref_data) - 1
+
+
+def test_06_empty_commodity_product():
+    """Test that a commodity derivative with an empty `Pdct` element, or an empty base product element, raises a
+    ValueError."""
+    for pdct in ("<Pdct></Pdct>", "<Pdct><Agrcltrl></Agrcltrl></Pdct>"):
+        elem = etree.fromstring(f"<Cmmdty>{pdct}</Cmmdty>")
+        with pytest.raises(ValueError):
+            CommodityDerivativeAttributes.from_xml(elem)
+
+
+def test_07_text_or_none_wrappers():
+    """Test that `text_or_none` looks up enum members by name and calls other wrappers, and that only enums are cached
+    by `enum_members`."""
+    elem = etree.fromstring("<FxTp>FXCR</FxTp>")
+    assert text_or_none(elem, FxType) is FxType.FXCR
+    assert enum_members(FxType)["FXCR"] is FxType.FXCR
+    assert text_or_none(etree.fromstring("<Val>1.5</Val>"), float) == 1.5
+    assert text_or_none(elem, lambda t: t.lower()) == "fxcr"
+    assert all(isinstance(cls, type) and issubclass(cls, Enum) for cls in _ENUM_MEMBERS)
@@ -2,7 +2,7 @@ import os
 from typing import Iterable
 
 from pyfirds.model import ReferenceData
-from pyfirds.xml_utils import iterparse
+from pyfirds.xml_utils import iterparse, parallel_iterparse
 from test.common import ESMA_FIRDS_FILES, verify_types, ESMA_FIRDS_DIR, FCA_FIRDS_DIR, FCA_FIRDS_FILES
 
 
@@ -93,3 +93,14 @@ def test_11_fulins_s():
     """Test parsing full swap instrument reference data."""
     iter_parse_files(ESMA_FIRDS_DIR, filter(lambda f: f.startswith("FULINS_S"), ESMA_FIRDS_FILES), "ref_data")
     iter_parse_files(FCA_FIRDS_DIR, filter(lambda f: f.startswith("FULINS_S"), FCA_FIRDS_FILES), "ref_data")
+
+
+def test_12_parallel():
+    """Test that parsing in worker processes gives the same results as parsing in a single process."""
+    for firds_dir, file_names in ((ESMA_FIRDS_DIR, ESMA_FIRDS_FILES), (FCA_FIRDS_DIR, FCA_FIRDS_FILES)):
+        for f in filter(lambda f: f.startswith("FULINS_D"), file_names):
+            print(f)
+            path = os.path.join(firds_dir, f)
+            tags = {"RefData": ReferenceData}
+            for serial, parallel in zip(iterparse(path, tags), parallel_iterparse(path, tags), strict=True):
+                assert serial == parallel
@@ -1,23 +1,16 @@
 import os
 from time import time
 
-from pyfirds.model import ReferenceData, NewRecord, ModifiedRecord, TerminatedRecord
+from pyfirds.model import RECORD_CLASSES
 from pyfirds.xml_utils import iterparse
 from test.common import ESMA_FIRDS_FILES, FIRDS_DIR, verify_types
 
-tags = {
-    "RefData": ReferenceData,
-    "NewRcrd": NewRecord,
-    "ModfdRcrd": ModifiedRecord,
-    "TermntdRcrd": TerminatedRecord
-}
-
 if __name__ == "__main__":
     for f in ESMA_FIRDS_FILES:
         print(f)
         count = {}
         t1 = time()
-        for obj in iterparse(os.path.join(FIRDS_DIR, f), tags):
+        for obj in iterparse(os.path.join(FIRDS_DIR, f), RECORD_CLASSES):
             t = type(obj)
             if t in count:
                 count[t] += 1